@@ -0,0 +1,246 @@
+"""Mixed-workload load test for the Kanban API, driven in-process through ASGI.
+
+Seeds users, projects and tasks, then runs concurrent virtual users that load
+boards, drag cards, poll the dashboard and log in. Reports throughput and
+p50/p95/p99 latency per route, and can compare against a stored baseline.
+
+No network access is needed: use --backend mongomock (requires mongomock-motor)
+or point MONGO_URL at a local mongod. A scratch database is used and dropped.
+
+Usage:
+    python benchmarks/load.py --backend mongomock --duration 30
+    python benchmarks/load.py --save-baseline benchmarks/baseline.json
+    python benchmarks/load.py --baseline benchmarks/baseline.json --max-regression 0.2
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+os.environ.setdefault("JWT_ALGORITHM", "HS256")
+os.environ.setdefault("JWT_EXPIRATION_HOURS", "1")
+# Keep logins representative but not dominant; override to match production
+os.environ.setdefault("BCRYPT_ROUNDS", "10")
+# Every virtual user shares one client address; the limiter would dominate
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ["DB_NAME"] = "kanban_load_benchmark"
+
+import httpx  # noqa: E402
+
+import server  # noqa: E402
+
+PASSWORD = "benchmark-password"
+STATUSES = ["todo", "in_progress", "done"]
+
+# (name, weight) of the operations a virtual user picks from
+WORKLOAD = [
+    ("board_load", 35),
+    ("card_move", 25),
+    ("dashboard_poll", 25),
+    ("projects_list", 10),
+    ("login", 5),
+]
+
+
+def percentile(sorted_samples: list, fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_samples) - 1))), len(sorted_samples) - 1)
+    return sorted_samples[index]
+
+
+def use_mongomock():
+    from mongomock_motor import AsyncMongoMockClient
+
+    server.client = AsyncMongoMockClient()
+    server.db = server.client[os.environ["DB_NAME"]]
+
+
+async def seed(users: int, projects_per_user: int, tasks_per_project: int) -> list:
+    hashed = await server.hash_password_async(PASSWORD)
+    now = datetime.now(timezone.utc)
+    accounts = []
+    for index in range(users):
+        user = server.User(name=f"Bench User {index}", email=f"bench{index}@example.com", hashed_password=hashed)
+        await server.db.users.insert_one(user.dict())
+        projects = [
+            server.Project(name=f"Project {p}", user_id=user.id) for p in range(projects_per_user)
+        ]
+        await server.db.projects.insert_many([project.dict() for project in projects])
+        tasks = []
+        for project in projects:
+            for t in range(tasks_per_project):
+                tasks.append(server.Task(
+                    title=f"Task {t} of {project.name}",
+                    description="Synthetic benchmark task",
+                    status=random.choice(STATUSES),
+                    priority=random.choice(["low", "medium", "high"]),
+                    due_date=now + timedelta(days=random.randint(-10, 30)),
+                    project_id=project.id,
+                    user_id=user.id,
+                ))
+        if tasks:
+            await server.db.tasks.insert_many([server.task_document(task) for task in tasks])
+        await server.reconcile_user_stats(user.id)
+        accounts.append({
+            "email": user.email,
+            "token": server.create_access_token(server.user_token_claims(user)),
+            "project_ids": [project.id for project in projects],
+            "task_ids": [task.id for task in tasks],
+        })
+    return accounts
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def call(self, route: str, request):
+        start = time.perf_counter()
+        try:
+            response = await request
+        except Exception:
+            self.errors[route] += 1
+            return None
+        self.samples[route].append((time.perf_counter() - start) * 1000)
+        if response.status_code >= 400:
+            self.errors[route] += 1
+        return response
+
+
+async def virtual_user(http: httpx.AsyncClient, account: dict, recorder: Recorder, deadline: float):
+    headers = {"Authorization": f"Bearer {account['token']}"}
+    names = [name for name, _ in WORKLOAD]
+    weights = [weight for _, weight in WORKLOAD]
+    while time.perf_counter() < deadline:
+        operation = random.choices(names, weights)[0]
+        if operation == "board_load":
+            project_id = random.choice(account["project_ids"])
+            await recorder.call("GET /api/projects/{id}", http.get(f"/api/projects/{project_id}", headers=headers))
+            await recorder.call("GET /api/tasks", http.get("/api/tasks", params={"project_id": project_id}, headers=headers))
+        elif operation == "card_move" and account["task_ids"]:
+            task_id = random.choice(account["task_ids"])
+            await recorder.call(
+                "PUT /api/tasks/{id}",
+                http.put(f"/api/tasks/{task_id}", json={"status": random.choice(STATUSES)}, headers=headers),
+            )
+        elif operation == "dashboard_poll":
+            await recorder.call("GET /api/dashboard/stats", http.get("/api/dashboard/stats", headers=headers))
+        elif operation == "projects_list":
+            await recorder.call("GET /api/projects", http.get("/api/projects", headers=headers))
+        elif operation == "login":
+            await recorder.call(
+                "POST /api/auth/login",
+                http.post("/api/auth/login", json={"email": account["email"], "password": PASSWORD}),
+            )
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    routes = {}
+    for route, samples in sorted(recorder.samples.items()):
+        samples.sort()
+        routes[route] = {
+            "requests": len(samples),
+            "errors": recorder.errors[route],
+            "throughput_rps": len(samples) / elapsed,
+            "p50_ms": percentile(samples, 0.50),
+            "p95_ms": percentile(samples, 0.95),
+            "p99_ms": percentile(samples, 0.99),
+        }
+    total = sum(route["requests"] for route in routes.values())
+    return {"elapsed_s": elapsed, "total_requests": total, "throughput_rps": total / elapsed, "routes": routes}
+
+
+def print_report(report: dict):
+    print(f"{'route':<28}{'reqs':>8}{'errs':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for route, stats in report["routes"].items():
+        print(f"{route:<28}{stats['requests']:>8}{stats['errors']:>6}{stats['throughput_rps']:>9.1f}"
+              f"{stats['p50_ms']:>9.2f}{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}")
+    print(f"total: {report['total_requests']} requests, {report['throughput_rps']:.1f} req/s")
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list:
+    regressions = []
+    for route, stats in report["routes"].items():
+        base = baseline["routes"].get(route)
+        if not base or not base["p95_ms"]:
+            continue
+        change = stats["p95_ms"] / base["p95_ms"] - 1
+        if change > max_regression:
+            regressions.append(f"{route}: p95 {base['p95_ms']:.2f}ms -> {stats['p95_ms']:.2f}ms (+{change:.0%})")
+    return regressions
+
+
+async def run(args) -> dict:
+    if args.backend == "mongomock":
+        use_mongomock()
+    await server.ensure_indexes()
+    random.seed(args.seed)
+    accounts = await seed(args.users, args.projects, args.tasks)
+    try:
+        recorder = Recorder()
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as http:
+            start = time.perf_counter()
+            deadline = start + args.duration
+            await asyncio.gather(*(
+                virtual_user(http, accounts[i % len(accounts)], recorder, deadline)
+                for i in range(args.concurrency)
+            ))
+            elapsed = time.perf_counter() - start
+        report = summarize(recorder, elapsed)
+        report["config"] = {key: getattr(args, key) for key in ("backend", "users", "projects", "tasks", "concurrency", "duration", "seed")}
+        report["platform"] = {"python": platform.python_version(), "machine": platform.machine()}
+        return report
+    finally:
+        await server.client.drop_database(os.environ["DB_NAME"])
+        server.client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["mongod", "mongomock"], default="mongod")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--projects", type=int, default=5, help="projects per user")
+    parser.add_argument("--tasks", type=int, default=50, help="tasks per project")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--save-baseline", type=Path, help="write the report as the new baseline")
+    parser.add_argument("--baseline", type=Path, help="compare p95 per route against this baseline")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed p95 increase (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    # One log line per request would dominate the run
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    report = asyncio.run(run(args))
+    print_report(report)
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.write_text(json.dumps(report, indent=2) + "\n")
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.max_regression)
+        if regressions:
+            print("Regressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
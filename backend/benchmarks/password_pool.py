@@ -0,0 +1,83 @@
+"""Event-loop lag during concurrent logins: inline bcrypt vs. the worker pool.
+
+Usage: python benchmarks/password_pool.py [--logins 32] [--rounds 12]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# server.py reads its configuration at import time; no database is contacted here.
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "kanban_benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+os.environ.setdefault("JWT_ALGORITHM", "HS256")
+os.environ.setdefault("JWT_EXPIRATION_HOURS", "1")
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.005) -> list:
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(time.perf_counter() - start - interval, 0.0))
+    return lags
+
+
+async def run(mode: str, logins: int, hashed: str) -> dict:
+    import server
+
+    async def inline_login():
+        server.verify_password("correct horse battery staple", hashed)
+        await asyncio.sleep(0)
+
+    async def pooled_login():
+        await server.verify_and_update_password("correct horse battery staple", hashed)
+
+    login = inline_login if mode == "inline" else pooled_login
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(measure_lag(stop))
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    lags = await monitor
+    lags.sort()
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "lag_p50_ms": statistics.median(lags) * 1000,
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1] * 1000 if len(lags) > 1 else lags[-1] * 1000,
+        "lag_max_ms": lags[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=12)
+    args = parser.parse_args()
+
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    # Let every login into the pool; we are measuring lag, not admission control
+    os.environ.setdefault("PASSWORD_HASH_QUEUE_LIMIT", str(args.logins))
+    import server
+
+    hashed = server.hash_password("correct horse battery staple")
+    print(f"{args.logins} concurrent logins, bcrypt rounds={args.rounds}, "
+          f"pool workers={server.password_hash_workers}")
+    for mode in ("inline", "pool"):
+        result = asyncio.run(run(mode, args.logins, hashed))
+        print(f"{result['mode']:>6}: total {result['elapsed_s']:.2f}s  "
+              f"loop lag p50 {result['lag_p50_ms']:.1f}ms  "
+              f"p99 {result['lag_p99_ms']:.1f}ms  max {result['lag_max_ms']:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
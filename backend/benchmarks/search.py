@@ -0,0 +1,105 @@
+"""Server-side task search vs. downloading every task and filtering in Python.
+
+Seeds synthetic tasks for one user into a scratch database and times both
+approaches for a handful of queries. Needs a reachable MongoDB (MONGO_URL,
+default mongodb://localhost:27017); the scratch database is dropped afterwards.
+
+Usage: python benchmarks/search.py [--tasks 100000] [--repeat 5]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+os.environ.setdefault("JWT_ALGORITHM", "HS256")
+os.environ.setdefault("JWT_EXPIRATION_HOURS", "1")
+os.environ["DB_NAME"] = "kanban_search_benchmark"
+
+import server  # noqa: E402
+
+WORDS = (
+    "api auth backend bug cache dashboard deploy design docs email export fix frontend "
+    "import index kanban login metrics migrate mobile onboarding payment performance "
+    "project refactor release report review search settings sidebar signup sprint "
+    "styling test theme upload ux webhook"
+).split()
+QUERIES = ["login", "perf", "dashboard cache", "mig", "release notes", "zzz"]
+
+
+def synthetic_task(user_id: str, project_ids: list) -> dict:
+    task = server.Task(
+        title=" ".join(random.sample(WORDS, 4)).capitalize(),
+        description=" ".join(random.choices(WORDS, k=12)),
+        priority=random.choice(["low", "medium", "high"]),
+        status=random.choice(server.TASK_STATUSES),
+        project_id=random.choice(project_ids),
+        user_id=user_id,
+        created_at=datetime.now(timezone.utc),
+    )
+    return server.task_document(task)
+
+
+async def seed(user_id: str, count: int):
+    project_ids = [str(uuid.uuid4()) for _ in range(20)] + [None]
+    batch = []
+    for _ in range(count):
+        batch.append(synthetic_task(user_id, project_ids))
+        if len(batch) == 5000:
+            await server.db.tasks.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await server.db.tasks.insert_many(batch, ordered=False)
+
+
+async def fetch_all_and_filter(user_id: str, q: str) -> list:
+    tokens = server.tokenize(q)
+    tasks = await server.db.tasks.find({"user_id": user_id}).to_list(None)
+    tasks = [server.Task(**task) for task in tasks]
+    return [
+        task for task in tasks
+        if all(token in f"{task.title} {task.description}".lower() for token in tokens)
+    ]
+
+
+async def timed(coro_factory, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await coro_factory()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+async def main(task_count: int, repeat: int):
+    user_id = str(uuid.uuid4())
+    await server.ensure_indexes()
+    print(f"Seeding {task_count} tasks...")
+    await seed(user_id, task_count)
+    try:
+        print(f"{'query':<18}{'hits':>8}{'search ms':>12}{'fetch-all ms':>15}")
+        for q in QUERIES:
+            result = await server.run_task_search(user_id, q)
+            search_ms = await timed(lambda: server.run_task_search(user_id, q), repeat)
+            fetch_ms = await timed(lambda: fetch_all_and_filter(user_id, q), max(1, repeat // 2))
+            print(f"{q:<18}{result['total']:>8}{search_ms:>12.1f}{fetch_ms:>15.1f}")
+    finally:
+        await server.client.drop_database(os.environ["DB_NAME"])
+        server.client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.repeat))
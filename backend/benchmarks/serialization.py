@@ -0,0 +1,91 @@
+"""Serialization cost of task list responses: validating path vs. fast path.
+
+The validating path mirrors what FastAPI does for `response_model=List[Task]`
+when a handler returns `[Task(**doc) for doc in docs]`: build the models,
+dump them, validate them again against the response model, convert to JSON
+types and encode with the standard json module. The fast path is the one used
+by list endpoints in SERIALIZATION_MODE=fast. Pure CPU, no database needed.
+
+Usage: python benchmarks/serialization.py [--sizes 1000 10000] [--repeat 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "kanban_benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+os.environ.setdefault("JWT_ALGORITHM", "HS256")
+os.environ.setdefault("JWT_EXPIRATION_HOURS", "1")
+
+import server  # noqa: E402
+
+
+def synthetic_docs(count: int) -> list:
+    # Shaped like documents read back from MongoDB (naive UTC datetimes)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    user_id = str(uuid.uuid4())
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "title": f"Task number {i}",
+            "description": "Synthetic task used to measure response serialization",
+            "priority": "medium",
+            "status": ("todo", "in_progress", "done")[i % 3],
+            "due_date": now + timedelta(days=i % 30),
+            "project_id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def validating_path(docs: list) -> bytes:
+    tasks = [server.Task(**doc) for doc in docs]
+    content = [task.model_dump() for task in tasks]
+    validated = server.task_list_adapter.validate_python(content)
+    data = server.task_list_adapter.dump_python(validated, mode="json")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def fast_path(docs: list) -> bytes:
+    adapter = server.task_list_adapter
+    return adapter.dump_json(adapter.validate_python(docs))
+
+
+def measure(func, docs: list, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(docs)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8}{'validating ms':>16}{'fast ms':>10}{'speedup':>10}")
+    for size in args.sizes:
+        docs = synthetic_docs(size)
+        assert json.loads(validating_path(docs)) == json.loads(fast_path(docs))
+        slow = measure(validating_path, docs, args.repeat)
+        fast = measure(fast_path, docs, args.repeat)
+        print(f"{size:>8}{slow:>16.2f}{fast:>10.2f}{slow / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import pytest
+from fastapi import HTTPException
+
+from server import (
+    RANK_MAX_LENGTH,
+    RANK_PATTERN,
+    TaskUpdate,
+    hinted_rank,
+    hints_out_of_order,
+    rank_between,
+    spaced_ranks,
+)
+
+
+def assert_valid(rank):
+    assert RANK_PATTERN.match(rank), rank
+
+
+@pytest.mark.parametrize("prev_rank, next_rank", [
+    (None, None),
+    (None, "1"),
+    ("z", None),
+    ("a", "b"),
+    ("a", "a1"),
+    ("az", "b"),
+    ("h", "hz"),
+    ("1", "z"),
+])
+def test_rank_between_sorts_strictly_between(prev_rank, next_rank):
+    rank = rank_between(prev_rank, next_rank)
+    assert_valid(rank)
+    if prev_rank is not None:
+        assert rank > prev_rank
+    if next_rank is not None:
+        assert rank < next_rank
+
+
+def test_repeated_appends_grow_slowly():
+    rank = None
+    for _ in range(200):
+        following = rank_between(rank, None)
+        assert rank is None or following > rank
+        rank = following
+    assert len(rank) < RANK_MAX_LENGTH
+
+
+def test_repeated_inserts_at_one_spot_keep_order():
+    low, high = "a", "b"
+    for _ in range(50):
+        rank = rank_between(low, high)
+        assert low < rank < high
+        assert_valid(rank)
+        high = rank
+
+
+def test_spaced_ranks_are_sorted_and_leave_room():
+    ranks = spaced_ranks(1000)
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == len(ranks)
+    for rank in ranks:
+        assert_valid(rank)
+    for low, high in zip(ranks, ranks[1:]):
+        assert low < rank_between(low, high) < high
+
+
+def test_hinted_rank_without_hints():
+    assert hinted_rank(TaskUpdate(status="done")) is None
+
+
+def test_hinted_rank_between_neighbours():
+    update = TaskUpdate(prev_rank="a", next_rank="c")
+    assert not hints_out_of_order(update)
+    assert "a" < hinted_rank(update) < "c"
+
+
+def test_hinted_rank_at_column_ends():
+    assert hinted_rank(TaskUpdate(next_rank="a")) < "a"
+    assert hinted_rank(TaskUpdate(prev_rank="a")) > "a"
+
+
+def test_hinted_rank_treats_empty_rank_as_column_start():
+    assert hinted_rank(TaskUpdate(prev_rank="", next_rank="a")) < "a"
+
+
+@pytest.mark.parametrize("prev_rank, next_rank", [("h", "h"), ("k", "c")])
+def test_hinted_rank_places_after_prev_when_neighbours_tie_or_invert(prev_rank, next_rank):
+    update = TaskUpdate(prev_rank=prev_rank, next_rank=next_rank)
+    assert hints_out_of_order(update)
+    rank = hinted_rank(update)
+    assert_valid(rank)
+    assert rank > prev_rank
+
+
+@pytest.mark.parametrize("field", ["prev_rank", "next_rank"])
+@pytest.mark.parametrize("value", ["A", "a0", "a-b"])
+def test_hinted_rank_rejects_malformed_keys(field, value):
+    with pytest.raises(HTTPException) as exc_info:
+        hinted_rank(TaskUpdate(**{field: value}))
+    assert exc_info.value.status_code == 400